@@ -1070,6 +1070,13 @@ async fn create_function(
         .await
         .map_err(|_| StatusCode::INTERNAL_SERVER_ERROR)?;
 
+    // Insert the function and its tag links in a single transaction
+    let mut tx = state
+        .db
+        .begin()
+        .await
+        .map_err(|_| StatusCode::INTERNAL_SERVER_ERROR)?;
+
     // Save function to database (disabled by default)
     sqlx::query!(
         "INSERT INTO functions (id, name, script_filename, function_type, created_at) VALUES (?, ?, ?, ?, ?)",
@@ -1079,7 +1086,7 @@ async fn create_function(
         payload.function_type,
         created_at
     )
-    .execute(&state.db)
+    .execute(&mut *tx)
     .await
     .map_err(|e| {
         if e.to_string().contains("UNIQUE constraint failed") {
@@ -1096,7 +1103,7 @@ async fn create_function(
             id,
             tag_id
         )
-        .execute(&state.db)
+        .execute(&mut *tx)
         .await;
     }
 
@@ -1107,10 +1114,14 @@ async fn create_function(
             id,
             tag_id
         )
-        .execute(&state.db)
+        .execute(&mut *tx)
         .await;
     }
 
+    tx.commit()
+        .await
+        .map_err(|_| StatusCode::INTERNAL_SERVER_ERROR)?;
+
     // Fetch tags for response
     let input_tags = sqlx::query_as!(
         Tag,
@@ -1266,40 +1277,53 @@ async fn update_function(
             })?;
     }
 
-    // Update input tags if provided
-    if let Some(input_tag_ids) = &payload.input_tag_ids {
-        sqlx::query!("DELETE FROM function_input_tags WHERE function_id = ?", id)
-            .execute(&state.db)
+    // Rewrite the tag links in a single transaction
+    if payload.input_tag_ids.is_some() || payload.output_tag_ids.is_some() {
+        let mut tx = state
+            .db
+            .begin()
             .await
             .map_err(|_| StatusCode::INTERNAL_SERVER_ERROR)?;
 
-        for tag_id in input_tag_ids {
-            let _ = sqlx::query!(
-                "INSERT INTO function_input_tags (function_id, tag_id) VALUES (?, ?)",
-                id,
-                tag_id
-            )
-            .execute(&state.db)
-            .await;
+        // Update input tags if provided
+        if let Some(input_tag_ids) = &payload.input_tag_ids {
+            sqlx::query!("DELETE FROM function_input_tags WHERE function_id = ?", id)
+                .execute(&mut *tx)
+                .await
+                .map_err(|_| StatusCode::INTERNAL_SERVER_ERROR)?;
+
+            for tag_id in input_tag_ids {
+                let _ = sqlx::query!(
+                    "INSERT INTO function_input_tags (function_id, tag_id) VALUES (?, ?)",
+                    id,
+                    tag_id
+                )
+                .execute(&mut *tx)
+                .await;
+            }
         }
-    }
 
-    // Update output tags if provided
-    if let Some(output_tag_ids) = &payload.output_tag_ids {
-        sqlx::query!("DELETE FROM function_output_tags WHERE function_id = ?", id)
-            .execute(&state.db)
-            .await
-            .map_err(|_| StatusCode::INTERNAL_SERVER_ERROR)?;
+        // Update output tags if provided
+        if let Some(output_tag_ids) = &payload.output_tag_ids {
+            sqlx::query!("DELETE FROM function_output_tags WHERE function_id = ?", id)
+                .execute(&mut *tx)
+                .await
+                .map_err(|_| StatusCode::INTERNAL_SERVER_ERROR)?;
 
-        for tag_id in output_tag_ids {
-            let _ = sqlx::query!(
-                "INSERT INTO function_output_tags (function_id, tag_id) VALUES (?, ?)",
-                id,
-                tag_id
-            )
-            .execute(&state.db)
-            .await;
+            for tag_id in output_tag_ids {
+                let _ = sqlx::query!(
+                    "INSERT INTO function_output_tags (function_id, tag_id) VALUES (?, ?)",
+                    id,
+                    tag_id
+                )
+                .execute(&mut *tx)
+                .await;
+            }
         }
+
+        tx.commit()
+            .await
+            .map_err(|_| StatusCode::INTERNAL_SERVER_ERROR)?;
     }
 
     // Update function_type if provided
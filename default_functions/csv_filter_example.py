@@ -1,10 +1,63 @@
 # /// script
 # requires-python = ">=3.11"
-# dependencies = ["pandas"]
+# dependencies = ["pyarrow"]
 # ///
 
 from pathlib import Path
-import pandas as pd
+import shutil
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+
+# Size of the blocks the CSV is read in; bounds memory while streaming
+BLOCK_SIZE = 16 << 20
+
+
+def _filter(batches, schema, output_path, threshold):
+    """Write the rows whose first numeric column is greater than threshold.
+
+    :param batches: Record batches of the CSV file.
+    :param schema: Schema of the batches.
+    :param output_path: Path to the filtered CSV file.
+    :param threshold: Rows must be strictly greater than this to be kept.
+    :return: The filter column and the total and kept row counts, or None
+        if there is no numeric column.
+    """
+    # Find the first numeric column straight from the inferred Arrow types
+    filter_column = next(
+        (
+            field.name
+            for field in schema
+            if pa.types.is_integer(field.type) or pa.types.is_floating(field.type)
+        ),
+        None,
+    )
+    if filter_column is None:
+        return None
+    
+    # Build the threshold once as a scalar of the column's own type, so the
+    # comparison kernel runs on matching types without a per-batch cast.
+    # More conditions can be fused into the same mask with pc.and_/pc.or_.
+    column_type = schema.field(filter_column).type
+    threshold_scalar = pa.scalar(threshold).cast(column_type)
+    
+    # Filter each batch and write the rows that pass
+    total_rows = 0
+    kept_rows = 0
+    try:
+        with pacsv.CSVWriter(output_path, schema) as writer:
+            for batch in batches:
+                mask = pc.greater(batch.column(filter_column), threshold_scalar)
+                filtered = batch.filter(mask)
+                writer.write_batch(filtered)
+                total_rows += batch.num_rows
+                kept_rows += filtered.num_rows
+    except Exception:
+        # Don't leave a partially filtered file behind
+        output_path.unlink(missing_ok=True)
+        raise
+    
+    return filter_column, total_rows, kept_rows
 
 
 def main(path: Path) -> Path:
@@ -16,28 +69,33 @@ def main(path: Path) -> Path:
     :param path: Path to the input CSV file.
     :return: Path to the filtered CSV file.
     """
-    # Read the CSV file
-    df = pd.read_csv(path)
-    
-    # Find the first numeric column
-    numeric_columns = df.select_dtypes(include=['number']).columns
-    if len(numeric_columns) == 0:
-        print("No numeric columns found, returning original file")
-        output_path = path.with_name(f"{path.stem}_filtered{path.suffix}")
-        df.to_csv(output_path, index=False)
-        return output_path
-    
-    filter_column = numeric_columns[0]
+    output_path = path.with_name(f"{path.stem}_filtered{path.suffix}")
     threshold = 100  # In the future, this could be a parameter
+    read_options = pacsv.ReadOptions(use_threads=True, block_size=BLOCK_SIZE)
     
-    # Filter the data
-    filtered_df = df[df[filter_column] > threshold]
+    # Stream the CSV file as record batches, parsed in parallel, so only one
+    # block of the file is held in memory at a time
+    reader = pacsv.open_csv(path, read_options=read_options)
+    try:
+        result = _filter(reader, reader.schema, output_path, threshold)
+    except pa.ArrowInvalid as e:
+        # A later block doesn't fit the types inferred from the first one;
+        # reading the whole file lets Arrow widen the column type instead.
+        # Parse errors (e.g. a row with too many columns) would fail again
+        if "CSV conversion error" not in str(e):
+            raise
+        print("Column types changed after the first block, reading whole file")
+        table = pacsv.read_csv(path, read_options=read_options)
+        result = _filter(table.to_batches(), table.schema, output_path, threshold)
     
-    # Create output path
-    output_path = path.with_name(f"{path.stem}_filtered{path.suffix}")
-    filtered_df.to_csv(output_path, index=False)
+    if result is None:
+        print("No numeric columns found, returning original file")
+        shutil.copyfile(path, output_path)
+        return output_path
     
+    filter_column, total_rows, kept_rows = result
+    kept_pct = kept_rows / total_rows * 100 if total_rows else 0.0
     print(f"Filtered {path.name} by {filter_column} > {threshold}")
-    print(f"Kept {len(filtered_df)} out of {len(df)} rows ({len(filtered_df)/len(df)*100:.1f}%)")
+    print(f"Kept {kept_rows} out of {total_rows} rows ({kept_pct:.1f}%)")
     
     return output_path
@@ -3,6 +3,7 @@
 # dependencies = ["pandas"]
 # ///
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 import pandas as pd
@@ -26,28 +27,36 @@ def main(path: Path) -> List[Path]:
     # Use the first column for splitting (or create groups if numeric)
     split_column = df.columns[0]
     
+    base_name = path.stem
+    
     # If the column has too many unique values, create groups
-    unique_values = df[split_column].unique()
-    if len(unique_values) > 10:
-        # Create groups of roughly equal size
-        df['_group'] = pd.qcut(df.index, q=3, labels=['group1', 'group2', 'group3'])
-        split_column = '_group'
-        unique_values = df[split_column].unique()
+    if df[split_column].nunique(dropna=False) > 10:
+        # Create groups of roughly equal size as contiguous row slices
+        n = len(df)
+        labels = ['group1', 'group2', 'group3']
+        k = len(labels)
+        outputs = [
+            (
+                path.parent / f"{base_name}_{label}.csv",
+                df.iloc[i * n // k : (i + 1) * n // k],
+            )
+            for i, label in enumerate(labels)
+        ]
+    else:
+        # Collect a file for each unique value (single pass over the data)
+        groups = df.groupby(split_column, sort=False, dropna=False)
+        outputs = [
+            (path.parent / f"{base_name}_{value}.csv", subset)
+            for value, subset in groups
+        ]
     
-    output_paths = []
-    base_name = path.stem
+    # The writes are independent, so issue them concurrently
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(outputs)))) as executor:
+        list(executor.map(lambda o: o[1].to_csv(o[0], index=False), outputs))
     
-    # Create a file for each unique value
-    for value in unique_values:
-        subset = df[df[split_column] == value]
-        if split_column == '_group':
-            # Remove the temporary group column
-            subset = subset.drop('_group', axis=1)
-        
-        output_path = path.parent / f"{base_name}_{value}.csv"
-        subset.to_csv(output_path, index=False)
+    output_paths = []
+    for output_path, subset in outputs:
         output_paths.append(output_path)
-        
         print(f"Created {output_path.name} with {len(subset)} rows")
     
     print(f"Split {path.name} into {len(output_paths)} files")
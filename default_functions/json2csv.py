@@ -1,28 +1,157 @@
 # /// script
 # requires-python = ">=3.11"
-# dependencies = ["pandas"]
+# dependencies = ["orjson", "pyarrow"]
 # ///
 
 from pathlib import Path
-import pandas as pd
+import orjson
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.json as paj
+
+
+def _json_layout(path: Path) -> str:
+    """Guess how a JSON file is laid out.
+
+    :param path: Path to the JSON file.
+    :return: ``"records"`` for an array, ``"lines"`` for newline-delimited
+        objects and ``"other"`` for anything else (e.g. column oriented
+        JSON).
+    """
+    with open(path, "rb") as f:
+        if f.read(1024).lstrip().startswith(b"["):
+            return "records"
+
+        f.seek(0)
+        lines = (line.strip() for line in f)
+        first = next((line for line in lines if line), b"")
+        try:
+            if not isinstance(orjson.loads(first), dict):
+                return "other"
+        except orjson.JSONDecodeError:
+            return "other"
+
+        # A single object on its own is read as a whole document
+        return "lines" if any(lines) else "other"
+
+
+def _as_text(value) -> str | None:
+    """Strings as they are, anything else (numbers, objects...) as JSON text."""
+    if value is None or isinstance(value, str):
+        return value
+    return orjson.dumps(value).decode()
+
+
+def _column(values: list) -> pa.Array:
+    """Build a column, as text if its values don't share one type."""
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # e.g. a field that holds an int in one record and a string in another
+        return pa.array([_as_text(value) for value in values], pa.string())
+
+
+def _table_from_rows(rows: list) -> pa.Table:
+    """Build a table from a list of objects, one column per key."""
+    names = list(dict.fromkeys(key for row in rows for key in row))
+    columns = {name: _column([row.get(name) for row in rows]) for name in names}
+    return pa.table(columns)
+
+
+def _read_records(path: Path) -> pa.Table:
+    """Read a JSON array of objects (or of plain values, as a single column)."""
+    # pyarrow's JSON reader only handles newline-delimited records
+    records = orjson.loads(path.read_bytes())
+    if not records:
+        return pa.table({})
+    if not all(isinstance(record, dict) for record in records):
+        return pa.table({"0": _column(records)})
+
+    try:
+        return pa.Table.from_struct_array(pa.array(records))
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return _table_from_rows(records)
+
+
+def _read_lines(path: Path) -> pa.Table:
+    """Read newline-delimited JSON."""
+    try:
+        return paj.read_json(
+            path,
+            read_options=paj.ReadOptions(use_threads=True, block_size=32 << 20),
+        )
+    except pa.ArrowInvalid:
+        # Arrow needs one type per field; decode the records one by one instead
+        with open(path, "rb") as f:
+            return _table_from_rows([orjson.loads(line) for line in f if line.strip()])
+
+
+def _read_document(path: Path) -> pa.Table:
+    """Read a single JSON document that isn't an array of records.
+
+    An object of objects or of lists is read as columns (the index keys of
+    column oriented JSON are dropped); any other object is a single row.
+    """
+    data = orjson.loads(path.read_bytes())
+    if not isinstance(data, dict):
+        return pa.table({"0": _column([data])})
+
+    values = list(data.values())
+    if values and all(isinstance(value, dict) for value in values):
+        index = list(dict.fromkeys(key for value in values for key in value))
+        return pa.table(
+            {
+                name: _column([column.get(key) for key in index])
+                for name, column in data.items()
+            }
+        )
+    if values and all(isinstance(value, list) for value in values):
+        return pa.table({name: _column(column) for name, column in data.items()})
+    return _table_from_rows([data])
+
+
+def _stringify_nested(table: pa.Table) -> pa.Table:
+    """Replace struct/list columns, which CSV can't hold, by their JSON text."""
+    for i, field in enumerate(table.schema):
+        if pa.types.is_nested(field.type):
+            values = [
+                None if value is None else orjson.dumps(value).decode()
+                for value in table.column(i).to_pylist()
+            ]
+            table = table.set_column(i, field.name, pa.array(values, pa.string()))
+    return table
 
 
 def main(path: Path) -> Path:
     """Convert a JSON file to CSV format.
 
+    Arrays of records are decoded with orjson and newline-delimited JSON
+    is read with pyarrow. Nested values are written as JSON text, and fields
+    whose values don't share a type as strings.
+
     :param path: Path to the input JSON file.
     :return: Path to the output CSV file.
     """
     # Read the JSON file
-    df = pd.read_json(path)
+    layout = _json_layout(path)
+    if layout == "records":
+        table = _read_records(path)
+    elif layout == "lines":
+        table = _read_lines(path)
+    else:
+        table = _read_document(path)
 
     # Define the output path with .csv extension
     csv_path = path.with_suffix(".csv")
 
-    # Write the DataFrame to a CSV file
-    df.to_csv(csv_path, index=False)
+    # Write the table to a CSV file
+    pacsv.write_csv(
+        _stringify_nested(table),
+        csv_path,
+        write_options=pacsv.WriteOptions(include_header=True),
+    )
 
     print(f"Successfully converted JSON to CSV: {csv_path}")
-    print(f"Rows: {len(df)}, Columns: {len(df.columns)}")
+    print(f"Rows: {table.num_rows}, Columns: {len(table.column_names)}")
 
     return csv_path
@@ -1,28 +1,123 @@
 # /// script
 # requires-python = ">=3.11"
-# dependencies = ["pandas", "pyarrow"]
+# dependencies = ["orjson", "pyarrow"]
 # ///
 
 from pathlib import Path
-import pandas as pd
+import base64
+import decimal
+import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+# Ticks per second for each Arrow time unit
+_UNITS_PER_SECOND = {"s": 1, "ms": 10**3, "us": 10**6, "ns": 10**9}
+
+
+def _has_temporal(type_: pa.DataType) -> bool:
+    """Whether a type is, or contains, a timestamp or duration."""
+    if pa.types.is_timestamp(type_) or pa.types.is_duration(type_):
+        return True
+    return any(_has_temporal(type_.field(i).type) for i in range(type_.num_fields))
+
+
+def _to_json_array(array: pa.Array) -> pa.Array:
+    """Convert timestamps/durations in an array to ISO strings/seconds.
+
+    Nested struct, list and map children are converted too, so that
+    ``to_pylist`` never has to build ``datetime``/``timedelta`` objects; it
+    can't for nanosecond units without pandas.
+    """
+    type_ = array.type
+    if not _has_temporal(type_):
+        return array
+
+    if pa.types.is_timestamp(type_):
+        fmt = "%Y-%m-%dT%H:%M:%S%z" if type_.tz else "%Y-%m-%dT%H:%M:%S"
+        return pc.strftime(array, format=fmt)
+    if pa.types.is_duration(type_):
+        ticks = array.cast(pa.int64()).cast(pa.float64())
+        return pc.divide(ticks, _UNITS_PER_SECOND[type_.unit])
+
+    mask = array.is_null()
+    if pa.types.is_struct(type_):
+        children = [_to_json_array(child) for child in array.flatten()]
+        return pa.StructArray.from_arrays(
+            children, names=[field.name for field in type_], mask=mask
+        )
+    if pa.types.is_fixed_size_list(type_):
+        size = type_.list_size
+        values = array.values.slice(array.offset * size, len(array) * size)
+        return pa.FixedSizeListArray.from_arrays(
+            _to_json_array(values), size, mask=mask
+        )
+
+    # Arrow can't combine a null mask with sliced offsets, so rebase the
+    # offsets (and the values they point into) to start at zero
+    offsets = array.offsets
+    start, end = offsets[0].as_py(), offsets[-1].as_py()
+    offsets = pc.subtract(offsets, start).cast(offsets.type)
+    if pa.types.is_map(type_):
+        return pa.MapArray.from_arrays(
+            offsets,
+            _to_json_array(array.keys.slice(start, end - start)),
+            _to_json_array(array.items.slice(start, end - start)),
+            mask=mask,
+        )
+    # list and large_list
+    values = _to_json_array(array.values.slice(start, end - start))
+    return type(array).from_arrays(offsets, values, mask=mask)
+
+
+def _to_json_types(batch: pa.RecordBatch) -> pa.RecordBatch:
+    """Convert timestamp/duration values in a batch to JSON-friendly types."""
+    columns = [_to_json_array(column) for column in batch.columns]
+    return pa.RecordBatch.from_arrays(columns, names=batch.schema.names)
+
+
+def _default(value):
+    """Serialize values orjson doesn't handle itself (e.g. bytes, decimals)."""
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode("ascii")
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
 
 
 def main(path: Path) -> Path:
     """Convert a Parquet file to JSON format.
 
+    Rows are streamed batch by batch into a JSON array of records.
+    Timestamps are written as ISO 8601 strings, durations as seconds and
+    binary values as base64.
+
     :param path: Path to the input Parquet file.
     :return: Path to the output JSON file.
     """
-    # Read the Parquet file
-    df = pd.read_parquet(path)
+    # Open the Parquet file (memory-mapped, so pages are read straight from
+    # the page cache instead of being copied into Python-managed buffers)
+    pf = pq.ParquetFile(path, memory_map=True)
 
     # Define the output path with .json extension
     json_path = path.with_suffix(".json")
 
-    # Write the DataFrame to a JSON file (records format for better readability)
-    df.to_json(json_path, orient="records", indent=2)
+    # Write the rows to a JSON file (records format for better readability)
+    with open(json_path, "wb") as fp:
+        fp.write(b"[\n")
+        first = True
+        # Columns are decoded and decompressed in parallel within each batch
+        for batch in pf.iter_batches(batch_size=50_000, use_threads=True):
+            for row in _to_json_types(batch).to_pylist():
+                if not first:
+                    fp.write(b",\n")
+                fp.write(
+                    orjson.dumps(row, default=_default, option=orjson.OPT_INDENT_2)
+                )
+                first = False
+        fp.write(b"\n]")
 
     print(f"Successfully converted Parquet to JSON: {json_path}")
-    print(f"Rows: {len(df)}, Columns: {len(df.columns)}")
+    print(f"Rows: {pf.metadata.num_rows}, Columns: {len(pf.schema_arrow)}")
 
     return json_path
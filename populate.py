@@ -1,6 +1,6 @@
 # /// script
 # requires-python = ">=3.11"
-# dependencies = ["requests"]
+# dependencies = ["httpx[http2]"]
 # ///
 
 """
@@ -12,47 +12,82 @@ Run this script to set up common file format tags and conversion functions.
 Usage: uv run populate.py
 """
 
-import requests
+import asyncio
+import httpx
 import os
 import shutil
 from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
 import uuid
 import json
 
 
 BASE_URL = os.environ.get("BASE_URL", "http://localhost:8080/api")
+DEFAULT_FUNCTIONS_DIR = Path("default_functions")
 
 
-def check_backend():
+@lru_cache
+def _script(name):
+    """Read a script from the default functions directory (once)."""
+    return (DEFAULT_FUNCTIONS_DIR / name).read_text()
+
+
+async def _is_up_to_date(
+    client,
+    existing_function,
+    script_content,
+    input_tag_ids,
+    output_tag_ids,
+    function_type,
+):
+    """Check whether an existing function already matches the given definition."""
+    # The function list doesn't include script content, so fetch it
+    response = await client.get(f"/functions/{existing_function['id']}")
+    if response.status_code != 200:
+        return False
+
+    func = response.json()
+    return (
+        func.get("script_content") == script_content
+        and func["function_type"] == function_type
+        and {t["id"] for t in func["input_tags"]} == set(input_tag_ids)
+        and {t["id"] for t in func["output_tags"]} == set(output_tag_ids)
+    )
+
+
+async def check_backend(client):
     """Check if the backend is running."""
     try:
-        response = requests.get(f"{BASE_URL}/health", timeout=5)
+        response = await client.get("/health", timeout=5)
         return response.status_code == 200
-    except requests.exceptions.RequestException:
+    except httpx.HTTPError:
         return False
 
 
-def create_tag_if_not_exists(name, color):
-    """Create a tag if it doesn't already exist."""
-    # Get all existing tags
-    response = requests.get(f"{BASE_URL}/tags")
+async def fetch_by_name(client, resource):
+    """Fetch all items of a resource (e.g. "tags") keyed by name."""
+    response = await client.get(f"/{resource}")
     if response.status_code != 200:
-        raise Exception(f"Failed to fetch tags: {response.status_code}")
+        raise Exception(f"Failed to fetch {resource}: {response.status_code}")
 
-    existing_tags = response.json()
+    return {item["name"]: item for item in response.json()}
 
+
+async def create_tag_if_not_exists(client, tags_by_name, name, color):
+    """Create a tag if it doesn't already exist."""
     # Check if tag exists
-    for tag in existing_tags:
-        if tag["name"] == name:
-            print(f"  Tag '{name}' already exists")
-            return tag["id"]
+    if name in tags_by_name:
+        print(f"  Tag '{name}' already exists")
+        return tags_by_name[name]["id"]
 
     # Create new tag
     tag_data = {"name": name, "color": color}
 
-    response = requests.post(f"{BASE_URL}/tags", json=tag_data)
+    response = await client.post("/tags", json=tag_data)
     if response.status_code == 201:
         tag = response.json()
+        tags_by_name[name] = tag
         print(f"  Created tag '{name}' with color {color}")
         return tag["id"]
     else:
@@ -61,25 +96,31 @@ def create_tag_if_not_exists(name, color):
         )
 
 
-def create_function_if_not_exists(
-    name, script_content, input_tag_ids, output_tag_ids, function_type="convert"
+async def create_function_if_not_exists(
+    client,
+    functions_by_name,
+    name,
+    script_content,
+    input_tag_ids,
+    output_tag_ids,
+    function_type="convert",
 ):
     """Create a function if it doesn't already exist, or update it if it does."""
-    # Get all existing functions
-    response = requests.get(f"{BASE_URL}/functions")
-    if response.status_code != 200:
-        raise Exception(f"Failed to fetch functions: {response.status_code}")
-
-    existing_functions = response.json()
-
     # Check if function exists
-    existing_function = None
-    for func in existing_functions:
-        if func["name"] == name:
-            existing_function = func
-            break
+    existing_function = functions_by_name.get(name)
 
     if existing_function:
+        if await _is_up_to_date(
+            client,
+            existing_function,
+            script_content,
+            input_tag_ids,
+            output_tag_ids,
+            function_type,
+        ):
+            print(f"  Function '{name}' already exists and is up to date")
+            return existing_function["id"]
+
         print(f"  Function '{name}' already exists, updating...")
 
         # Update the existing function
@@ -91,8 +132,8 @@ def create_function_if_not_exists(
             "function_type": function_type,
         }
 
-        response = requests.put(
-            f"{BASE_URL}/functions/{existing_function['id']}", json=update_data
+        response = await client.put(
+            f"/functions/{existing_function['id']}", json=update_data
         )
         if response.status_code == 200:
             updated_func = response.json()
@@ -115,9 +156,10 @@ def create_function_if_not_exists(
             "function_type": function_type,
         }
 
-        response = requests.post(f"{BASE_URL}/functions", json=function_data)
+        response = await client.post("/functions", json=function_data)
         if response.status_code == 201:
             func = response.json()
+            functions_by_name[name] = func
             print(
                 f"  Created function '{name}' (type: {function_type}) - {len(func['input_tags'])} input, {len(func['output_tags'])} output"
             )
@@ -128,74 +170,91 @@ def create_function_if_not_exists(
             )
 
 
-def populate_database():
+async def populate_database():
     """Populate the database with default tags and functions."""
     print("🚀 Populating DataLab database with defaults...")
 
+    # Independent requests overlap; over HTTPS they are multiplexed on one
+    # HTTP/2 connection, plain http:// falls back to pooled HTTP/1.1
+    async with httpx.AsyncClient(http2=True, base_url=BASE_URL) as client:
+        await _populate(client)
+
+
+async def _populate(client):
+    """Create the default tags and functions using the given client."""
     # Check if backend is running
-    if not check_backend():
+    if not await check_backend(client):
         print("❌ Backend is not running! Please start the backend first:")
         print("   cd backend && cargo run")
         return
 
     try:
+        # Fetch existing tags and functions once, up front
+        tags_by_name, functions_by_name = await asyncio.gather(
+            fetch_by_name(client, "tags"), fetch_by_name(client, "functions")
+        )
+
         print("\n📋 Creating default tags...")
 
-        # Create file extension tags
-        csv_tag_id = create_tag_if_not_exists(".csv", "#10b981")  # green
-        parquet_tag_id = create_tag_if_not_exists(".parquet", "#3b82f6")  # blue
-        json_tag_id = create_tag_if_not_exists(".json", "#f59e0b")  # amber
+        # Create file extension tags (concurrently, order is preserved)
+        csv_tag_id, parquet_tag_id, json_tag_id = await asyncio.gather(
+            # green
+            create_tag_if_not_exists(client, tags_by_name, ".csv", "#10b981"),
+            # blue
+            create_tag_if_not_exists(client, tags_by_name, ".parquet", "#3b82f6"),
+            # amber
+            create_tag_if_not_exists(client, tags_by_name, ".json", "#f59e0b"),
+        )
 
         # Create additional useful tags
 
         print("\n⚙️  Creating default functions...")
 
-        # Read function scripts from default_functions directory
-        default_functions_dir = "default_functions"
-
-        # CSV to Parquet converter
-        with open(os.path.join(default_functions_dir, "csv2parquet.py"), "r") as f:
-            csv2parquet_script = f.read()
-
-        create_function_if_not_exists(
-            name="csv2parquet",
-            script_content=csv2parquet_script,
-            input_tag_ids=[csv_tag_id],
-            output_tag_ids=[parquet_tag_id],
-            function_type="convert",  # Format conversion, don't show duplicate visualizations
-        )
-
-        # Parquet to JSON converter
-        with open(os.path.join(default_functions_dir, "parquet2json.py"), "r") as f:
-            parquet2json_script = f.read()
-
-        create_function_if_not_exists(
-            name="parquet2json",
-            script_content=parquet2json_script,
-            input_tag_ids=[parquet_tag_id],
-            output_tag_ids=[json_tag_id],
-            function_type="convert",  # Format conversion
-        )
-
-        # JSON to CSV converter
-        with open(os.path.join(default_functions_dir, "json2csv.py"), "r") as f:
-            json2csv_script = f.read()
-
-        create_function_if_not_exists(
-            name="json2csv",
-            script_content=json2csv_script,
-            input_tag_ids=[json_tag_id],
-            output_tag_ids=[csv_tag_id],
-            function_type="convert",  # Format conversion
+        functions = [
+            # CSV to Parquet converter
+            dict(
+                name="csv2parquet",
+                script_content=_script("csv2parquet.py"),
+                input_tag_ids=[csv_tag_id],
+                output_tag_ids=[parquet_tag_id],
+                function_type="convert",  # Format conversion, don't show duplicate visualizations
+            ),
+            # Parquet to JSON converter
+            dict(
+                name="parquet2json",
+                script_content=_script("parquet2json.py"),
+                input_tag_ids=[parquet_tag_id],
+                output_tag_ids=[json_tag_id],
+                function_type="convert",  # Format conversion
+            ),
+            # JSON to CSV converter
+            dict(
+                name="json2csv",
+                script_content=_script("json2csv.py"),
+                input_tag_ids=[json_tag_id],
+                output_tag_ids=[csv_tag_id],
+                function_type="convert",  # Format conversion
+            ),
+        ]
+
+        # The functions are independent, so upload them concurrently
+        await asyncio.gather(
+            *(
+                create_function_if_not_exists(client, functions_by_name, **function)
+                for function in functions
+            )
         )
 
         print("\n✅ Database population completed successfully!")
         print("\n📊 Summary:")
 
+        tags_response, functions_response = await asyncio.gather(
+            client.get("/tags"), client.get("/functions")
+        )
+
         # Show created tags
-        response = requests.get(f"{BASE_URL}/tags")
-        if response.status_code == 200:
-            all_tags = response.json()
+        if tags_response.status_code == 200:
+            all_tags = tags_response.json()
             relevant_tags = [
                 t
                 for t in all_tags
@@ -206,9 +265,8 @@ def populate_database():
                 print(f"    {tag['name']} ({tag['color']})")
 
         # Show created functions
-        response = requests.get(f"{BASE_URL}/functions")
-        if response.status_code == 200:
-            all_functions = response.json()
+        if functions_response.status_code == 200:
+            all_functions = functions_response.json()
             relevant_functions = [
                 f
                 for f in all_functions
@@ -232,4 +290,4 @@ def populate_database():
 
 
 if __name__ == "__main__":
-    populate_database()
+    asyncio.run(populate_database())